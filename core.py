@@ -0,0 +1,316 @@
+import ast
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from pyvis.network import Network
+
+class _CallCollector:
+    """Collect (caller, callee) pairs for every call inside a function body"""
+    def __init__(self, parent, edges, attribute_name, visit_nested):
+        self.parent = parent
+        self.edges = edges
+        self.attribute_name = attribute_name
+        self.visit_nested = visit_nested
+
+    def collect(self, node, Call=ast.Call, Attribute=ast.Attribute, Name=ast.Name,
+                FunctionDef=ast.FunctionDef, AsyncFunctionDef=ast.AsyncFunctionDef):
+        # AST node classes are bound as defaults so the checks below use locals, not global lookups
+        iter_child_nodes = ast.iter_child_nodes
+        edges = self.edges
+        parent = self.parent
+        stack = list(iter_child_nodes(node))
+        while stack:
+            n = stack.pop()
+            n_type = type(n)
+            if n_type is FunctionDef or n_type is AsyncFunctionDef:
+                # Nested functions are walked by their own visit, so each node is seen exactly once
+                self.visit_nested(n, parent=parent)
+                continue
+            if n_type is Call:
+                func = n.func
+                func_type = type(func)
+                if func_type is Attribute:
+                    value = func.value
+                    value_type = type(value)
+                    if value_type is Name:
+                        callee = f"{value.id}.{func.attr}"
+                    elif value_type is Attribute:
+                        # Handle chained attributes like obj.attr.method
+                        callee = self.attribute_name(value) + f".{func.attr}"
+                    else:
+                        callee = func.attr
+                    edges[(parent, callee)] = None
+                elif func_type is Name:
+                    edges[(parent, func.id)] = None
+            stack.extend(iter_child_nodes(n))
+
+class CodeAnalyzer(ast.NodeVisitor):
+    def __init__(self, module_name):
+        self.module_name = module_name
+        self.classes = {}
+        self.standalone_funcs = []
+        self.inheritance = {}
+        # Keys of a dict: duplicates collapse while first-seen order is kept
+        self.edges = {}
+        self.func_info = {}
+        self.modules = {}
+        self._visited = set()
+
+    def visit_ClassDef(self, node):
+        class_name = f"{self.module_name}.{node.name}"
+        self.modules[class_name] = self.module_name
+        bases = [base.id for base in node.bases if isinstance(base, ast.Name)]
+        self.inheritance[class_name] = f"{self.module_name}.{bases[0]}" if bases else None
+        self.classes[class_name] = []
+
+        for n in node.body:
+            if isinstance(n, ast.FunctionDef):
+                method_name = f"{class_name}.{n.name}"
+                self.classes[class_name].append(method_name)
+                self.func_info[method_name] = self.get_func_info(n)
+                self.visit_FunctionDef(n, parent=method_name)
+        self.generic_visit(node)
+
+    def visit_FunctionDef(self, node, parent=None):
+        # Methods are visited from visit_ClassDef; skip them when generic_visit reaches them again
+        if id(node) in self._visited:
+            return
+        self._visited.add(id(node))
+        name = f"{self.module_name}.{node.name}" if parent is None else parent
+        if parent is None:
+            self.standalone_funcs.append(name)
+            self.func_info[name] = self.get_func_info(node)
+
+        # Calls inside nested functions are attributed to the enclosing function, which is the node shown
+        _CallCollector(name, self.edges, self.get_full_attribute_name, self.visit_FunctionDef).collect(node)
+
+    def get_full_attribute_name(self, node):
+        """Get the full name of an attribute chain, walking it from the outermost attribute inwards"""
+        parts = []
+        current = node
+        while isinstance(current, ast.Attribute):
+            parts.append(current.attr)
+            current = current.value
+        parts.append(current.id if isinstance(current, ast.Name) else "unknown")
+        return ".".join(reversed(parts))
+
+    @staticmethod
+    def get_func_info(node):
+        args = [a.arg for a in node.args.args]
+        signature = f"({', '.join(args)})"
+        doc = ast.get_docstring(node) or "No docstring"
+        return f"{node.name}{signature}\n{doc}"
+
+def python_files(folder):
+    """List every .py file below folder"""
+    return [str(p) for p in Path(folder).rglob("*.py") if p.is_file()]
+
+def module_name_for(path, folder):
+    return os.path.splitext(os.path.relpath(path, folder))[0].replace(os.sep, ".")
+
+def _analyze(tree, module_name):
+    analyzer = CodeAnalyzer(module_name)
+    analyzer.visit(tree)
+    return (analyzer.classes, analyzer.standalone_funcs, analyzer.inheritance,
+            analyzer.edges, analyzer.func_info, analyzer.modules)
+
+def merge_results(results, selected_classes=None):
+    """Combine per-file analysis results, keeping only selected classes if given"""
+    all_classes, all_funcs, all_inheritance, all_edges, all_func_info, all_modules = {}, [], {}, {}, {}, {}
+    sel = frozenset(selected_classes or ())
+    for result in results:
+        classes, standalone_funcs, inheritance, edges, func_info, modules = result
+
+        # Filter classes if specific classes are selected
+        if selected_classes:
+            filtered_classes = {c: m for c, m in classes.items() if c.rsplit('.', 1)[-1] in sel}
+            filtered_inheritance = {c: inheritance[c] for c in filtered_classes if c in inheritance}
+            filtered_modules = {c: modules.get(c, 'main') for c in filtered_classes}
+            filtered_func_info = {m: func_info[m] for methods in filtered_classes.values() for m in methods if m in func_info}
+
+            # Keep edges where the source or destination names a selected class in one of its dotted parts
+            filtered_edges = {(src, dst): None for src, dst in edges
+                              if not sel.isdisjoint(src.split('.')) or not sel.isdisjoint(dst.split('.'))}
+
+            all_classes.update(filtered_classes)
+            all_inheritance.update(filtered_inheritance)
+            all_modules.update(filtered_modules)
+            all_func_info.update(filtered_func_info)
+            all_edges.update(filtered_edges)
+            all_funcs.extend([f for f in standalone_funcs if not sel.isdisjoint(f.split('.'))])
+        else:
+            # Include everything if no classes are selected
+            all_classes.update(classes)
+            all_funcs.extend(standalone_funcs)
+            all_inheritance.update(inheritance)
+            all_edges.update(edges)
+            all_func_info.update(func_info)
+            all_modules.update(modules)
+    return all_classes, all_funcs, all_inheritance, list(all_edges), all_func_info, all_modules
+
+def _parse_one(task):
+    """Parse and analyze a single file; runs in a worker process"""
+    path, module_name = task
+    try:
+        with open(path, "rb") as f:
+            tree = ast.parse(f.read(), filename=path)
+        return _analyze(tree, module_name)
+    except Exception as e:
+        print(f"Failed to parse {path}: {e}")
+        return None
+
+def parse_files(tasks):
+    """Parse and analyze (path, module_name) tasks in a process pool; files that fail come back as None"""
+    if not tasks:
+        return []
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        return list(executor.map(_parse_one, tasks, chunksize=8))
+
+# Shared by every node of a kind; pyvis only serializes these, so aliasing one dict is safe
+_CLUSTER_FONT = {"size": 36, "face": "Arial"}
+_METHOD_FONT = {"size": 30, "face": "Arial", "multi": True}
+
+_JS_SNIPPET = """
+<script>
+// Loading overlay
+var overlay = document.createElement('div');
+overlay.id = 'loadingOverlay';
+overlay.style.position = 'fixed';
+overlay.style.top = '0';
+overlay.style.left = '0';
+overlay.style.width = '100%';
+overlay.style.height = '100%';
+overlay.style.backgroundColor = 'rgba(255,255,255,0.8)';
+overlay.style.zIndex = '9999';
+overlay.style.display = 'flex';
+overlay.style.justifyContent = 'center';
+overlay.style.alignItems = 'center';
+overlay.style.fontSize = '24px';
+overlay.innerHTML = 'Loading network...';
+document.body.appendChild(overlay);
+
+// Hide overlay after first full draw
+network.once('afterDrawing', function() {
+    setTimeout(function() {
+        overlay.style.display = 'none';
+        network.body.data.nodes.update(network.body.data.nodes.getIds().map(function(id) {
+            return {id: id, physics: true};
+        }));
+        network.fit({animation: true});
+        
+        // Add instructions
+        var instructions = document.createElement('div');
+        instructions.style.position = 'absolute';
+        instructions.style.top = '10px';
+        instructions.style.right = '10px';
+        instructions.style.backgroundColor = 'rgba(255, 255, 255, 0.8)';
+        instructions.style.padding = '10px';
+        instructions.style.borderRadius = '5px';
+        instructions.style.fontSize = '14px';
+        instructions.style.zIndex = '1000';
+        instructions.innerHTML = '<strong>Legend:</strong><br>' +
+                                 '<span style="color:blue">Blue</span>: Inheritance<br>' +
+                                 '<span style="color:red">Red</span>: Function calls<br>' +
+                                 '<span style="color:#888">Gray</span>: Class methods';
+        document.body.appendChild(instructions);
+    }, 100);
+});
+</script>
+<style>
+    body {
+        margin: 0;
+        padding: 0;
+        font-family: Arial, sans-serif;
+        overflow: hidden;
+    }
+    
+    #mynetwork {
+        position: absolute;
+        top: 0;
+        left: 0;
+        right: 0;
+        bottom: 0;
+    }
+</style>
+"""
+
+def add_node_batch(net, ids, font, **attrs):
+    """Add a group of nodes with one add_nodes call, then apply the options add_nodes does not accept"""
+    first = len(net.nodes)
+    net.add_nodes(ids, **attrs)
+    for node in net.nodes[first:]:
+        node["font"] = font
+        # Physics is switched on by the injected script once the first draw has finished
+        node["physics"] = False
+
+def visualize_interactive(classes, standalone_funcs, inheritance, edges, func_info, modules, output_file="code_diagram.html"):
+    net = Network(height="900px", width="100%", directed=True, notebook=False, bgcolor="#f0f0f0",
+                  cdn_resources="remote")
+    net.force_atlas_2based(gravity=-100, central_gravity=0.01, spring_length=200)
+
+    cluster_children = {}
+    known = set()
+    module_colors = ["#89CFF0", "#a0c4ff", "#b9fbc0", "#ffb347", "#ff6961", "#caffbf", "#ffd6a5"]
+    module_color_map = {}
+    all_module_names = list(set(modules.values()))
+    for i, mod in enumerate(all_module_names):
+        module_color_map[mod] = module_colors[i % len(module_colors)]
+
+    # Add class clusters
+    cluster_ids, cluster_labels, cluster_colors = [], [], []
+    method_ids, method_titles, method_colors = [], [], []
+    for cls, methods in classes.items():
+        color = module_color_map[modules.get(cls, 'main')]
+        cluster_id = f"cluster_{cls}"
+        cluster_ids.append(cluster_id)
+        cluster_labels.append(cls)
+        cluster_colors.append(color)
+        cluster_children[cluster_id] = methods
+        for m in methods:
+            method_ids.append(m)
+            method_titles.append(func_info.get(m, "No info"))
+            method_colors.append(color)
+
+    add_node_batch(net, cluster_ids, _CLUSTER_FONT,
+                   label=cluster_labels, color=cluster_colors, shape=["box"] * len(cluster_ids))
+    add_node_batch(net, method_ids, _METHOD_FONT,
+                   label=method_ids, title=method_titles, color=method_colors, shape=["box"] * len(method_ids))
+
+    # Standalone functions
+    add_node_batch(net, standalone_funcs, _METHOD_FONT,
+                   label=standalone_funcs, title=[func_info.get(f, "No info") for f in standalone_funcs],
+                   color=["#b9fbc0"] * len(standalone_funcs), shape=["ellipse"] * len(standalone_funcs))
+    known.update(cluster_ids, method_ids, standalone_funcs)
+
+    # Edges are appended as plain dicts (the form Network.add_edge stores) to skip its per-call node checks
+    # Add edges from classes to their methods
+    for cluster_id, methods in cluster_children.items():
+        for m in methods:
+            net.edges.append({"from": cluster_id, "to": m, "arrows": "to", "color": "#888888", "width": 1, "smooth": True})
+
+    # Inheritance edges
+    # Parent clusters are never re-added here; an edge is drawn only when both clusters already exist
+    for cls, parent in inheritance.items():
+        if not parent:
+            continue
+        parent_id, cluster_id = f"cluster_{parent}", f"cluster_{cls}"
+        if parent_id in known and cluster_id in known:
+            net.edges.append({"from": parent_id, "to": cluster_id, "arrows": "to", "color": "blue",
+                              "title": "Inheritance", "width": 3, "smooth": True})
+
+    # Function call edges
+    for src, dst in edges:
+        # Check if both source and destination exist in our nodes
+        if src in known and dst in known:
+            net.edges.append({"from": src, "to": dst, "arrows": "to", "color": "red",
+                              "title": "Function call", "width": 2, "smooth": True})
+
+    # Render in memory so the JS can be injected before the file is written once
+    html = net.generate_html(output_file, notebook=False)
+
+    html = html.replace("</body>", _JS_SNIPPET + "</body>")
+
+    with open(output_file, "w", encoding="utf-8") as f:
+        f.write(html)
+
+    print(f"Interactive diagram ready: {output_file}")